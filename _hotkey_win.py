@@ -0,0 +1,146 @@
+"""Windows 用グローバルホットキー: RegisterHotKey + 専用メッセージループ.
+
+keyboard ライブラリの低レベルフックはシステム全体のキー入力ごとに
+Python コールバックを呼ぶが、RegisterHotKey なら登録した組み合わせが
+押されたときだけ OS から WM_HOTKEY が届く。
+"""
+
+from __future__ import annotations
+
+import ctypes
+import threading
+from ctypes import wintypes
+from typing import Callable
+
+# --- Win32 定数 ---
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000
+
+WM_QUIT = 0x0012
+WM_USER = 0x0400
+WM_HOTKEY = 0x0312
+WM_APP = 0x8000
+PM_NOREMOVE = 0x0000
+
+# ホットキーの有効/無効切替（登録はメッセージループのスレッドで行う必要がある）
+_WM_ENABLE = WM_APP + 1
+_WM_DISABLE = WM_APP + 2
+
+_MODIFIERS = {
+    "ctrl": MOD_CONTROL,
+    "shift": MOD_SHIFT,
+    "alt": MOD_ALT,
+    "win": MOD_WIN,
+}
+_NAMED_KEYS = {
+    "esc": 0x1B,
+    "space": 0x20,
+    "enter": 0x0D,
+    "tab": 0x09,
+}
+
+
+def parse_hotkey(hotkey: str) -> tuple[int, int]:
+    """"ctrl+shift+a" 形式の文字列を (修飾キーフラグ, 仮想キーコード) に変換する."""
+    mods = MOD_NOREPEAT
+    vk: int | None = None
+    for token in hotkey.lower().split("+"):
+        token = token.strip()
+        if token in _MODIFIERS:
+            mods |= _MODIFIERS[token]
+        elif token in _NAMED_KEYS:
+            vk = _NAMED_KEYS[token]
+        elif len(token) == 1 and token.isalnum():
+            vk = ord(token.upper())
+        elif token[:1] == "f" and token[1:].isdigit() and 1 <= int(token[1:]) <= 24:
+            vk = 0x70 + int(token[1:]) - 1  # VK_F1 = 0x70
+        else:
+            raise ValueError(f"未対応のキー指定です: {token!r} ({hotkey})")
+    if vk is None:
+        raise ValueError(f"ホットキーにキーが含まれていません: {hotkey}")
+    return mods, vk
+
+
+class HotkeyListener:
+    """専用スレッドで RegisterHotKey したホットキーを監視する.
+
+    コールバックはリスナースレッドから呼ばれるので、UI 操作は
+    呼び出し側でメインスレッドに委譲すること。
+    """
+
+    def __init__(self) -> None:
+        self._hotkeys: dict[int, tuple[int, int, Callable[[], None]]] = {}
+        self._enabled: dict[int, bool] = {}
+        self._thread: threading.Thread | None = None
+        self._thread_id: int | None = None
+        self._ready = threading.Event()
+
+    def add(
+        self, hotkey: str, callback: Callable[[], None], enabled: bool = True
+    ) -> int:
+        """ホットキーを追加して ID を返す (start() の前に呼ぶ)."""
+        hotkey_id = len(self._hotkeys) + 1
+        mods, vk = parse_hotkey(hotkey)
+        self._hotkeys[hotkey_id] = (mods, vk, callback)
+        self._enabled[hotkey_id] = enabled
+        return hotkey_id
+
+    def start(self) -> None:
+        """メッセージループのスレッドを開始する."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def set_enabled(self, hotkey_id: int, enabled: bool) -> None:
+        """ホットキーを一時的に登録/解除する (Esc など常時奪いたくないキー用)."""
+        if self._enabled.get(hotkey_id) == enabled:
+            return
+        self._enabled[hotkey_id] = enabled
+        self._post(_WM_ENABLE if enabled else _WM_DISABLE, hotkey_id)
+
+    def stop(self) -> None:
+        """メッセージループを終了する (ホットキーは全て解除される)."""
+        self._post(WM_QUIT, 0)
+
+    # --- Internal ---
+
+    def _post(self, message: int, wparam: int) -> None:
+        if self._thread_id is not None:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, message, wparam, 0)
+
+    def _register(self, hotkey_id: int) -> None:
+        mods, vk, _ = self._hotkeys[hotkey_id]
+        if not ctypes.windll.user32.RegisterHotKey(None, hotkey_id, mods, vk):
+            print(f"⚠ ホットキーの登録に失敗しました (他のアプリが使用中?): id={hotkey_id}")
+
+    def _run(self) -> None:
+        user32 = ctypes.windll.user32
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+
+        # PostThreadMessage を受け取れるよう、先にメッセージキューを作っておく
+        msg = wintypes.MSG()
+        user32.PeekMessageW(ctypes.byref(msg), None, WM_USER, WM_USER, PM_NOREMOVE)
+        for hotkey_id, enabled in self._enabled.items():
+            if enabled:
+                self._register(hotkey_id)
+        self._ready.set()
+
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY:
+                    entry = self._hotkeys.get(msg.wParam)
+                    if entry:
+                        try:
+                            entry[2]()
+                        except Exception as e:
+                            print(f"⚠ ホットキー処理エラー: {e}")
+                elif msg.message == _WM_ENABLE:
+                    self._register(msg.wParam)
+                elif msg.message == _WM_DISABLE:
+                    user32.UnregisterHotKey(None, msg.wParam)
+        finally:
+            for hotkey_id in self._hotkeys:
+                user32.UnregisterHotKey(None, hotkey_id)
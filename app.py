@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import enum
+import sys
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
-import keyboard
 import customtkinter as ctk
+import numpy as np
 
+import audio_kernels
 import config
 from recorder import AudioRecorder
 from injector import TextInjector
 from ui.floating_window import AppState, FloatingWindow
 
+# 音量メーターのポーリング間隔 (ms) — 音声ブロック毎ではなく UI の都合で更新する
+VOLUME_POLL_MS = 33
+
 
 def _create_stt_client():
     """API キーがあれば Gemini、なければローカル Whisper を返す."""
@@ -29,6 +35,7 @@ class Phase(enum.Enum):
     """アプリ全体のフェーズ."""
 
     IDLE = "idle"
+    LOADING = "loading"
     RECORDING = "recording"
     PROCESSING = "processing"
     PREVIEW = "preview"
@@ -45,12 +52,20 @@ class App:
         self._emphasis: list[dict] = []
 
         # --- サブモジュール初期化 ---
-        self._recorder = AudioRecorder(
-            on_silence=self._on_silence_detected,
-            on_volume=self._on_volume_update,
-        )
-        self._gemini = _create_stt_client()
+        # 沈黙検知カーネルの初回 JIT コンパイルを先に済ませる
+        audio_kernels.warmup()
+        self._recorder = AudioRecorder(on_silence=self._on_silence_detected)
+        # STT クライアントは UI 表示後にバックグラウンドで読み込む (Whisper は数秒かかる)
+        self._gemini = None
+        self._stt_error: str | None = None
+        # ローカル Whisper には WAV を経由せず float32 配列を直接渡す
+        self._stt_takes_array = not config.GEMINI_API_KEY
+        self._stt_ready = threading.Event()
         self._injector = TextInjector()
+        # テキスト注入（ブロッキング処理）用のワーカー。セッション間で使い回す
+        self._inject_pool = ThreadPoolExecutor(max_workers=1)
+        # 沈黙検知は閾値到達後ブロック毎に届くので、UI スレッドへは 1 件だけ積む
+        self._silence_scheduled = False
 
         # --- UI (customtkinter) ---
         ctk.set_appearance_mode("dark")
@@ -66,10 +81,26 @@ class App:
                 "cancel": self._cancel,
             },
         )
+        # 音量メーターのポーリングは録音中だけ回す
+        self._volume_job: str | None = None
 
         # --- グローバルホットキー ---
-        keyboard.add_hotkey(config.HOTKEY, self._on_hotkey, suppress=True)
-        keyboard.on_press_key("esc", self._on_esc_press)
+        self._hotkeys = None
+        if sys.platform == "win32":
+            # RegisterHotKey: 登録したキーが押されたときだけ OS から通知が来る
+            from _hotkey_win import HotkeyListener
+            self._hotkeys = HotkeyListener()
+            self._hotkeys.add(config.HOTKEY, self._on_hotkey)
+            # Esc は他アプリから奪わないよう、セッション中だけ登録する
+            self._esc_hotkey = self._hotkeys.add("esc", self._on_esc_press, enabled=False)
+            self._hotkeys.start()
+        else:
+            import keyboard
+            keyboard.add_hotkey(config.HOTKEY, self._on_hotkey, suppress=True)
+            keyboard.on_press_key("esc", self._on_esc_press)
+
+        threading.Thread(target=self._load_stt, daemon=True).start()
+        threading.Thread(target=self._warmup, daemon=True).start()
 
     # --- Public ---
 
@@ -85,10 +116,58 @@ class App:
 
     def shutdown(self) -> None:
         """アプリケーションを終了する."""
+        if self._hotkeys:
+            self._hotkeys.stop()
         self._recorder.close()
+        self._inject_pool.shutdown(wait=False)
+        if self._volume_job is not None:
+            self._root.after_cancel(self._volume_job)
+            self._volume_job = None
         self._floating.destroy()
         self._root.quit()
 
+    # --- STT 読み込み ---
+
+    def _load_stt(self) -> None:
+        """STT クライアントを生成する (バックグラウンドスレッド)."""
+        try:
+            self._gemini = _create_stt_client()
+        except Exception as e:
+            print(f"❌ STT クライアントの初期化に失敗: {e}")
+            self._stt_error = str(e)
+        finally:
+            self._stt_ready.set()
+            self._root.after(0, self._on_stt_ready)
+
+    def _warmup(self) -> None:
+        """初回セッションで払うはずの一度きりのコストを先に済ませる (バックグラウンド).
+
+        Gemini は TLS/DNS 接続、Whisper は初回推論。
+        """
+        self._stt_ready.wait()
+        if self._gemini is not None:
+            self._gemini.warm()
+
+    def _on_stt_ready(self) -> None:
+        """読み込み完了: 読み込み中表示を出していれば閉じる.
+
+        初期化に失敗していたら、録音しても処理できないのでエラーを出して終了する。
+        """
+        if self._gemini is None:
+            from tkinter import messagebox
+            self._floating.hide()
+            messagebox.showerror(
+                "VoiceDraft",
+                f"音声認識の初期化に失敗しました。\n\n{self._stt_error}",
+            )
+            self._root.quit()  # shutdown() は main() の finally で呼ばれる
+            return
+        if self._phase == Phase.LOADING:
+            print(f"✅  準備完了 — [{config.HOTKEY}] で録音を開始できます")
+            self._floating.hide()
+            self._phase = Phase.IDLE
+            self._set_esc_active(False)
+
     # --- ホットキーハンドラ ---
 
     def _on_hotkey(self) -> None:
@@ -98,12 +177,17 @@ class App:
         elif self._phase == Phase.RECORDING:
             self._root.after(0, self._manual_stop_recording)
 
-    def _on_esc_press(self, event) -> None:
+    def _on_esc_press(self, event=None) -> None:
         """Esc: キャンセルして閉じる."""
         if self._phase == Phase.IDLE:
             return
         self._root.after(0, self._cancel)
 
+    def _set_esc_active(self, active: bool) -> None:
+        """Esc ホットキーの登録/解除 (Windows の RegisterHotKey 使用時のみ)."""
+        if self._hotkeys:
+            self._hotkeys.set_enabled(self._esc_hotkey, active)
+
     def _manual_stop_recording(self) -> None:
         """手動で録音を停止して処理に進む."""
         if self._phase == Phase.RECORDING:
@@ -113,6 +197,14 @@ class App:
 
     def _start_session(self) -> None:
         """新規セッション開始: ウィンドウ表示 + 録音開始."""
+        self._set_esc_active(True)
+        if not self._stt_ready.is_set():
+            # モデル読み込み中は録音を始めず、読み込み中表示だけ出す
+            print("⏳  モデル読み込み中...")
+            self._phase = Phase.LOADING
+            self._floating.show(AppState.LOADING)
+            return
+
         print("\n🚀 セッション開始")
         self._draft = ""
         self._question = None
@@ -125,6 +217,7 @@ class App:
         self._phase = Phase.RECORDING
         self._floating.show(AppState.RECORDING)
         self._recorder.start()
+        self._start_volume_polling()
         print("🎙  録音中...")
 
     def _start_followup_recording(self) -> None:
@@ -133,24 +226,47 @@ class App:
         self._phase = Phase.RECORDING
         self._floating.show(AppState.RECORDING)
         self._recorder.start()
+        self._start_volume_polling()
 
     def _on_silence_detected(self) -> None:
         """沈黙検知コールバック (録音スレッドから呼ばれる)."""
-        if self._phase != Phase.RECORDING:
+        if self._phase != Phase.RECORDING or self._silence_scheduled:
             return
-        # UI スレッドに処理を委譲
-        self._root.after(0, self._process_audio)
+        # UI スレッドに処理を委譲 (処理されるまで後続の通知は捨てる)
+        self._silence_scheduled = True
+        self._root.after_idle(self._drain_silence)
 
-    def _on_volume_update(self, rms: float) -> None:
-        """音量更新コールバック (録音スレッドから呼ばれる)."""
+    def _drain_silence(self) -> None:
+        """沈黙検知の通知を UI スレッドで 1 回だけ処理する."""
+        self._silence_scheduled = False
         if self._phase == Phase.RECORDING:
-            self._root.after(0, lambda: self._floating.update_volume(rms))
+            self._process_audio()
+
+    def _start_volume_polling(self) -> None:
+        """音量メーターのポーリングを開始する (既に回っていれば何もしない)."""
+        if self._volume_job is None:
+            self._volume_job = self._root.after(VOLUME_POLL_MS, self._poll_volume)
+
+    def _poll_volume(self) -> None:
+        """音量メーターを更新する (録音中だけ UI スレッドで約 30Hz 周期)."""
+        if self._phase != Phase.RECORDING:
+            self._volume_job = None
+            return
+        self._floating.update_volume(self._recorder.latest_rms)
+        self._volume_job = self._root.after(VOLUME_POLL_MS, self._poll_volume)
 
     def _process_audio(self) -> None:
         """録音停止 → Gemini API 送信."""
         print("⏹  沈黙検知 — 録音停止")
-        audio_bytes = self._recorder.get_audio_bytes()
-        if not audio_bytes:
+        if self._stt_takes_array:
+            audio = self._recorder.get_audio_array()
+        else:
+            audio = self._recorder.get_audio_buffer()
+        if audio is None:
+            if self._recorder.no_speech and self._draft:
+                # 追加録音が空振りしただけなので、これまでの清書は残してプレビューに戻る
+                self._show_preview()
+                return
             print("⚠  音声データなし")
             self._cancel()
             return
@@ -161,17 +277,18 @@ class App:
 
         # API 呼び出しはバックグラウンドスレッドで
         thread = threading.Thread(
-            target=self._call_gemini, args=(audio_bytes,), daemon=True
+            target=self._call_gemini, args=(audio,), daemon=True
         )
         thread.start()
 
-    def _call_gemini(self, audio_bytes: bytes) -> None:
+    def _call_gemini(self, audio: memoryview | np.ndarray) -> None:
         """Gemini API をバックグラウンドで呼び出す."""
+        self._stt_ready.wait()
         try:
             context = self._draft if self._draft else None
             emphasis = self._emphasis if self._emphasis else None
             result = self._gemini.transcribe_and_structure(
-                audio_bytes, context, emphasis,
+                audio, context, emphasis,
             )
             self._draft = result.get("draft", "")
             self._question = result.get("question")
@@ -188,6 +305,9 @@ class App:
         except Exception as e:
             print(f"❌ Gemini API エラー: {e}")
             self._root.after(0, self._cancel)
+        finally:
+            if isinstance(audio, memoryview):
+                self._recorder.release_buffer(audio)
 
     def _show_preview(self) -> None:
         """プレビュー画面を表示する."""
@@ -204,12 +324,27 @@ class App:
         self._root.after(200, self._do_inject)
 
     def _do_inject(self) -> None:
-        """実際のテキスト注入."""
-        success = self._injector.inject_text(self._draft)
+        """テキスト注入をワーカースレッドに投げる (UI スレッドはブロックしない)."""
+        future = self._inject_pool.submit(self._injector.inject_text, self._draft)
+        future.add_done_callback(self._on_injected)
+
+    def _on_injected(self, future: Future) -> None:
+        """テキスト注入完了 (ワーカースレッドから呼ばれる) → 結果を UI スレッドに渡す."""
+        try:
+            success = future.result()
+        except Exception as e:
+            print(f"❌ テキスト注入エラー: {e}")
+            success = False
+        self._root.after(0, self._finish_inject, success)
+
+    def _finish_inject(self, success: bool) -> None:
+        """注入結果を表示してセッションを終える (UI スレッド)."""
         if success:
             print("💾  テキストを入力しました")
         else:
             print("⚠  テキスト入力に失敗しました")
+        # Esc を外してから IDLE にする (次のセッションの Esc 登録と入れ違わないように)
+        self._set_esc_active(False)
         self._phase = Phase.IDLE
 
     def _cancel(self) -> None:
@@ -219,3 +354,4 @@ class App:
             self._recorder.stop()
         self._floating.hide()
         self._phase = Phase.IDLE
+        self._set_esc_active(False)
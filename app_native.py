@@ -8,18 +8,22 @@ from __future__ import annotations
 
 import enum
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
+import numpy as np
 import objc
 from AppKit import (
     NSApplication,
     NSApplicationActivationPolicyAccessory,
+    NSBeep,
     NSEvent,
     NSKeyDownMask,
     NSEventModifierFlagControl,
     NSEventModifierFlagShift,
 )
-from Foundation import NSObject, NSOperationQueue
+from Foundation import NSObject, NSOperationQueue, NSTimer
 
+import audio_kernels
 import config
 from recorder import AudioRecorder
 from injector import TextInjector
@@ -27,6 +31,10 @@ from native_window import NativeFloatingWindow
 from native_statusbar import StatusBarController
 
 
+# 確定後、ウィンドウ切替を待ってからペーストするまでの遅延（秒）
+INJECT_DELAY = 0.2
+
+
 # ── メインスレッド dispatch ────────────────────────────────
 def _main(func) -> None:
     """func をメインスレッドで実行（スレッドセーフ）."""
@@ -36,6 +44,7 @@ def _main(func) -> None:
 # ── フェーズ ────────────────────────────────────────────────
 class Phase(enum.Enum):
     IDLE       = "idle"
+    LOADING    = "loading"
     RECORDING  = "recording"
     PROCESSING = "processing"
     PREVIEW    = "preview"
@@ -69,20 +78,23 @@ class NativeVoiceDraftApp:
         self._hotkey_monitor = None
 
         # --- バックエンド ---
-        self._recorder = AudioRecorder(
-            on_silence=self._on_silence_detected,
-            on_volume=self._on_volume_update,
-        )
+        # 沈黙検知カーネルの初回 JIT コンパイルを先に済ませる
+        audio_kernels.warmup()
+        self._recorder = AudioRecorder(on_silence=self._on_silence_detected)
         self._injector = TextInjector()
-
-        # STT クライアント選択
-        if config.GEMINI_API_KEY:
-            from gemini_client import GeminiClient
-            self._stt = GeminiClient()
-        else:
-            print("ℹ  GEMINI_API_KEY 未設定 → ローカル Whisper モード")
-            from whisper_client import WhisperClient
-            self._stt = WhisperClient()
+        # テキスト注入（ブロッキング処理）用のワーカー。セッション間で使い回す
+        self._inject_pool = ThreadPoolExecutor(max_workers=1)
+        # 沈黙検知は閾値到達後ブロック毎に届くので、メインキューへは 1 件だけ積む
+        self._silence_scheduled = False
+
+        # STT クライアントはバックグラウンドで読み込む (Whisper は数秒かかる)
+        self._stt = None
+        self._stt_error: str | None = None
+        # ローカル Whisper には WAV を経由せず float32 配列を直接渡す
+        self._stt_takes_array = not config.GEMINI_API_KEY
+        self._stt_ready = threading.Event()
+        threading.Thread(target=self._load_stt, daemon=True).start()
+        threading.Thread(target=self._warmup, daemon=True).start()
 
         # --- Cocoa アプリ ---
         self._app = NSApplication.sharedApplication()
@@ -111,7 +123,9 @@ class NativeVoiceDraftApp:
                 "retry":   self._start_followup_recording,
                 "confirm": self._confirm_and_inject,
                 "cancel":  self._cancel,
-            }
+            },
+            # 音量メーター: 録音スレッドからは dispatch せず、ウィンドウが描画に合わせて読みに行く
+            volume_source=lambda: self._recorder.latest_rms,
         )
         self._statusbar = StatusBarController.alloc().init()
         self._statusbar.setup(quit_callback=self.shutdown)
@@ -119,6 +133,54 @@ class NativeVoiceDraftApp:
         # グローバルホットキー登録
         self._register_hotkey()
         print("✅  VoiceDraft 起動完了")
+        if self._stt_ready.is_set() and self._stt is None:
+            self._show_stt_error()  # 起動完了前に STT の初期化が失敗していた
+
+    # ── STT 読み込み ──────────────────────────────────────
+
+    def _load_stt(self) -> None:
+        """STT クライアントを選択・生成する（バックグラウンドスレッド）."""
+        try:
+            if config.GEMINI_API_KEY:
+                from gemini_client import GeminiClient
+                self._stt = GeminiClient()
+            else:
+                print("ℹ  GEMINI_API_KEY 未設定 → ローカル Whisper モード")
+                from whisper_client import WhisperClient
+                self._stt = WhisperClient()
+        except Exception as e:
+            print(f"❌ STT クライアントの初期化に失敗: {e}")
+            self._stt_error = str(e)
+        finally:
+            self._stt_ready.set()
+            _main(self._on_stt_ready)
+
+    def _warmup(self) -> None:
+        """初回セッションの一度きりのコスト (TLS 接続 / 初回推論) を先に払う."""
+        self._stt_ready.wait()
+        if self._stt is not None:
+            self._stt.warm()
+
+    def _on_stt_ready(self) -> None:
+        if self._stt is None:
+            if self._phase == Phase.LOADING:
+                self._window.hide()
+                self._phase = Phase.IDLE
+            self._show_stt_error()
+            return
+        if self._phase == Phase.LOADING:
+            print("✅  準備完了 — Ctrl+Shift+A で録音を開始できます")
+            self._window.hide()
+            self._statusbar.set_icon("🎙")
+            self._statusbar.set_status("待機中")
+            self._phase = Phase.IDLE
+
+    def _show_stt_error(self) -> None:
+        """STT 初期化失敗をメニューバーに出したままにする (録音は受け付けない)."""
+        if getattr(self, "_statusbar", None) is None:
+            return  # 起動完了前 → _on_app_launched で表示する
+        self._statusbar.set_icon("⚠️")
+        self._statusbar.set_status(f"音声認識の初期化に失敗: {self._stt_error}")
 
     # ── ホットキー ────────────────────────────────────────
 
@@ -145,6 +207,22 @@ class NativeVoiceDraftApp:
     # ── フロー制御 ─────────────────────────────────────────
 
     def _start_session(self) -> None:
+        if not self._stt_ready.is_set():
+            # モデル読み込み中は録音を始めず、読み込み中表示だけ出す
+            print("⏳  モデル読み込み中...")
+            self._phase = Phase.LOADING
+            self._statusbar.set_icon("⏳")
+            self._statusbar.set_status("モデル読み込み中...")
+            self._window.show_loading()
+            return
+
+        if self._stt is None:
+            # 録音しても処理できないので始めない
+            print(f"❌ 音声認識が使えません: {self._stt_error}")
+            NSBeep()
+            self._show_stt_error()
+            return
+
         print("\n🚀 セッション開始")
         self._draft = ""
         self._question = None
@@ -170,17 +248,26 @@ class NativeVoiceDraftApp:
             self._process_audio()
 
     def _on_silence_detected(self) -> None:
-        if self._phase == Phase.RECORDING:
-            _main(self._process_audio)
+        if self._phase == Phase.RECORDING and not self._silence_scheduled:
+            self._silence_scheduled = True
+            _main(self._drain_silence)
 
-    def _on_volume_update(self, rms: float) -> None:
+    def _drain_silence(self) -> None:
+        self._silence_scheduled = False
         if self._phase == Phase.RECORDING:
-            _main(lambda: self._window.update_volume(rms))
+            self._process_audio()
 
     def _process_audio(self) -> None:
         print("⏹  録音停止 — 処理中...")
-        audio_bytes = self._recorder.get_audio_bytes()
-        if not audio_bytes:
+        if self._stt_takes_array:
+            audio = self._recorder.get_audio_array()
+        else:
+            audio = self._recorder.get_audio_buffer()
+        if audio is None:
+            if self._recorder.no_speech and self._draft:
+                # 追加録音が空振りしただけなので、これまでの清書は残してプレビューに戻る
+                self._show_preview()
+                return
             print("⚠  音声データなし")
             self._cancel()
             return
@@ -191,13 +278,14 @@ class NativeVoiceDraftApp:
         self._window.show_processing()
 
         threading.Thread(
-            target=self._call_stt, args=(audio_bytes,), daemon=True
+            target=self._call_stt, args=(audio,), daemon=True
         ).start()
 
-    def _call_stt(self, audio_bytes: bytes) -> None:
+    def _call_stt(self, audio: memoryview | np.ndarray) -> None:
+        self._stt_ready.wait()
         try:
             result = self._stt.transcribe_and_structure(
-                audio_bytes,
+                audio,
                 self._draft or None,
                 self._emphasis or None,
             )
@@ -211,6 +299,9 @@ class NativeVoiceDraftApp:
         except Exception as e:
             print(f"❌ STT エラー: {e}")
             _main(self._cancel)
+        finally:
+            if isinstance(audio, memoryview):
+                self._recorder.release_buffer(audio)
 
     def _show_preview(self) -> None:
         self._phase = Phase.PREVIEW
@@ -224,12 +315,24 @@ class NativeVoiceDraftApp:
         self._phase = Phase.INJECTING
         self._statusbar.set_icon("🎙")
         self._statusbar.set_status("待機中")
-        threading.Thread(target=self._delayed_inject, daemon=True).start()
+        NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
+            INJECT_DELAY, False, self._fire_inject
+        )
+
+    def _fire_inject(self, timer) -> None:
+        future = self._inject_pool.submit(self._injector.inject_text, self._draft)
+        future.add_done_callback(self._on_injected)
+
+    def _on_injected(self, future: Future) -> None:
+        """注入ワーカーから呼ばれる → 結果はメインスレッドで反映する."""
+        try:
+            success = future.result()
+        except Exception as e:
+            print(f"❌ テキスト注入エラー: {e}")
+            success = False
+        _main(lambda: self._finish_inject(success))
 
-    def _delayed_inject(self) -> None:
-        import time
-        time.sleep(0.2)
-        success = self._injector.inject_text(self._draft)
+    def _finish_inject(self, success: bool) -> None:
         print("💾  テキストを入力しました" if success else "⚠  テキスト入力に失敗")
         self._phase = Phase.IDLE
 
@@ -247,5 +350,6 @@ class NativeVoiceDraftApp:
         if self._hotkey_monitor:
             NSEvent.removeMonitor_(self._hotkey_monitor)
         self._recorder.close()
+        self._inject_pool.shutdown(wait=False)
         self._window.destroy()
         self._app.terminate_(None)
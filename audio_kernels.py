@@ -0,0 +1,81 @@
+"""録音まわりの数値カーネル.
+
+numba がインストールされていれば RMS + 沈黙判定のループを JIT コンパイルし、
+なければ同じ処理を NumPy で行う。
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+except ImportError:
+    njit = None
+
+
+def _rms_and_silence_loop(
+    block: np.ndarray, threshold: float, prev_silent_frames: int
+) -> tuple[float, int]:
+    """1 パスで二乗和を取り、RMS と連続沈黙フレーム数を返す (numba 用)."""
+    frames, channels = block.shape
+    n = frames * channels
+    if n == 0:
+        return 0.0, prev_silent_frames
+    s = 0.0
+    for i in range(frames):
+        for j in range(channels):
+            x = block[i, j]
+            s += x * x
+    rms = math.sqrt(s / n)
+    if rms < threshold:
+        return rms, prev_silent_frames + frames
+    return rms, 0
+
+
+def _rms_and_silence_numpy(
+    block: np.ndarray, threshold: float, prev_silent_frames: int
+) -> tuple[float, int]:
+    """NumPy 版（numba 未インストール時のフォールバック）."""
+    if block.size == 0:
+        return 0.0, prev_silent_frames
+    # block**2 の一時配列を作らず、BLAS の内積で二乗和を取る
+    flat = block.reshape(-1)
+    rms = math.sqrt(float(np.dot(flat, flat)) / flat.size)
+    if rms < threshold:
+        return rms, prev_silent_frames + block.shape[0]
+    return rms, 0
+
+
+# rms_and_silence(block, threshold, prev_silent_frames) -> (rms, silent_frames)
+#   block: (frames, channels) の float32 配列
+#   閾値未満なら沈黙フレーム数を加算、以上なら 0 に戻す
+if njit is not None:
+    try:
+        rms_and_silence = njit(cache=True, fastmath=True)(_rms_and_silence_loop)
+    except RuntimeError:
+        # zip に入った .pyc だけ (py2app の compressed ビルド等) だとキャッシュ先を
+        # 決められず例外になる → キャッシュなしで毎回起動時にコンパイルする
+        rms_and_silence = njit(fastmath=True)(_rms_and_silence_loop)
+else:
+    rms_and_silence = _rms_and_silence_numpy
+
+
+def downmix(data: np.ndarray) -> np.ndarray:
+    """(frames, channels) をモノラルの float32 配列にする.
+
+    mean(axis=1) と違い float64 の中間配列を作らず、出力 1 本に直接加算する。
+    """
+    mono = np.empty(data.shape[0], dtype=np.float32)
+    np.add(data[:, 0], data[:, 1], out=mono)
+    for ch in range(2, data.shape[1]):
+        np.add(mono, data[:, ch], out=mono)
+    mono *= 1.0 / data.shape[1]
+    return mono
+
+
+def warmup() -> None:
+    """ダミーデータで一度呼び、初回の JIT コンパイルを済ませておく."""
+    rms_and_silence(np.zeros((1, 1), dtype=np.float32), 0.0, 0)
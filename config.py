@@ -1,6 +1,7 @@
 """アプリケーション全体の設定定数."""
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -8,31 +9,59 @@ from dotenv import load_dotenv
 # .env ファイルの読み込み
 load_dotenv(Path(__file__).parent / ".env")
 
-# --- ホットキー ---
-# macOS では ctrl+shift+a = ⌃⇧A（アクセシビリティ権限が必要）
-HOTKEY = "ctrl+shift+a"
-
-# --- 録音 ---
-SAMPLE_RATE = 16000  # Whisper 互換
-CHANNELS = 1
-DTYPE = "float32"
-
-# --- 沈黙検知 ---
-SILENCE_THRESHOLD = 0.01  # RMS 閾値 (高めで環境音に寛容)
-SILENCE_DURATION = 2.5  # 秒 (フォールバック; 手動停止を推奨)
-
-# --- Gemini API ---
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
-# GEMINI_MODEL = "gemini-3-flash-preview"
-GEMINI_MODEL = "gemini-2.5-flash"
-
-# --- ローカル Whisper (API キー未設定時の自動フォールバック) ---
-# モデルサイズ: tiny / base / small / medium / large
-# tiny=最速・精度低, base=バランス良好(推奨), small=高精度, medium=日本語向け最良
-WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
-
-# --- UI ---
-WINDOW_BG = "#1a1a2e"
-ACCENT_COLOR = "#e94560"
-TEXT_COLOR = "#eaeaea"
-SUBTEXT_COLOR = "#a0a0b0"
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """設定値. import 時に一度だけ組み立てる (変更不可)."""
+
+    # --- ホットキー ---
+    # macOS では ctrl+shift+a = ⌃⇧A（アクセシビリティ権限が必要）
+    HOTKEY: str = "ctrl+shift+a"
+
+    # --- 録音 ---
+    SAMPLE_RATE: int = 16000  # Whisper 互換
+    CHANNELS: int = 1
+    DTYPE: str = "float32"
+    MAX_RECORD_SECONDS: int = 120  # 録音バッファの初期確保長 (超えたら拡張)
+
+    # --- 沈黙検知 ---
+    SILENCE_THRESHOLD: float = 0.01  # RMS 閾値 (高めで環境音に寛容)
+    SILENCE_DURATION: float = 2.5  # 秒 (フォールバック; 手動停止を推奨)
+
+    # --- Gemini API ---
+    GEMINI_API_KEY: str = ""
+    # GEMINI_MODEL: str = "gemini-3-flash-preview"
+    GEMINI_MODEL: str = "gemini-2.5-flash"
+
+    # --- ローカル Whisper (API キー未設定時の自動フォールバック) ---
+    # モデルサイズ: tiny / base / small / medium / large
+    # tiny=最速・精度低, base=バランス良好(推奨), small=高精度, medium=日本語向け最良
+    WHISPER_MODEL: str = "base"
+
+    # --- UI ---
+    WINDOW_BG: str = "#1a1a2e"
+    ACCENT_COLOR: str = "#e94560"
+    TEXT_COLOR: str = "#eaeaea"
+    SUBTEXT_COLOR: str = "#a0a0b0"
+
+
+CFG = _Config(
+    GEMINI_API_KEY=os.getenv("GEMINI_API_KEY", ""),
+    WHISPER_MODEL=os.getenv("WHISPER_MODEL", "base"),
+)
+
+# --- 後方互換: config.XXX でも参照できるようモジュール属性として公開 ---
+HOTKEY = CFG.HOTKEY
+SAMPLE_RATE = CFG.SAMPLE_RATE
+CHANNELS = CFG.CHANNELS
+DTYPE = CFG.DTYPE
+MAX_RECORD_SECONDS = CFG.MAX_RECORD_SECONDS
+SILENCE_THRESHOLD = CFG.SILENCE_THRESHOLD
+SILENCE_DURATION = CFG.SILENCE_DURATION
+GEMINI_API_KEY = CFG.GEMINI_API_KEY
+GEMINI_MODEL = CFG.GEMINI_MODEL
+WHISPER_MODEL = CFG.WHISPER_MODEL
+WINDOW_BG = CFG.WINDOW_BG
+ACCENT_COLOR = CFG.ACCENT_COLOR
+TEXT_COLOR = CFG.TEXT_COLOR
+SUBTEXT_COLOR = CFG.SUBTEXT_COLOR
@@ -2,14 +2,37 @@
 
 from __future__ import annotations
 
+import importlib.util
+import io
 import json
 import re
 
+import httpx
 from google import genai
 from google.genai import types
 
 import config
 
+try:
+    import orjson  # type: ignore[import-not-found]
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 設定値は import 時に一度だけ束縛する
+_API_KEY = config.CFG.GEMINI_API_KEY
+_MODEL = config.CFG.GEMINI_MODEL
+
+# コードフェンス除去用 (応答は通常 JSON のみなのでフォールバック時だけ使う)
+_FENCE_RE = re.compile(r"```(?:json)?\s*")
+
+# インライン送信の上限 (バイト)。これを超える録音は Files API でアップロードする
+# 16kHz mono 16bit で約 4 分。インラインだと base64 化でさらに 1.33 倍になる
+INLINE_AUDIO_LIMIT = 8 * 1024 * 1024
+
+# HTTP/2 で接続を多重化する (h2 は httpx[http2] 依存で入る。欠けた環境では HTTP/1.1 のまま)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 # --- システムプロンプト ---
 SYSTEM_PROMPT = """\
 あなたは音声入力アシスタントです。
@@ -31,79 +54,169 @@ SYSTEM_PROMPT = """\
 }
 """
 
+# コンテキストなし (初回) のユーザー指示は毎回同じなので使い回す
+_USER_TEXT = "この音声を清書してください。"
+_USER_TEXT_BASE = types.Part.from_text(text=_USER_TEXT)
+
 
 class GeminiClient:
     """Gemini API を使って音声を清書テキスト + 問いに変換する."""
 
     def __init__(self) -> None:
-        if not config.GEMINI_API_KEY:
+        if not _API_KEY:
             raise RuntimeError(
                 "GEMINI_API_KEY が設定されていません。.env ファイルを確認してください。"
             )
+        # セッション間で TLS 接続を使い回せるよう keep-alive を長めに取る
+        self._http = httpx.Client(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300),
+        )
         self._client = genai.Client(
-            api_key=config.GEMINI_API_KEY,
-            http_options={"timeout": 20_000},  # 20秒タイムアウト (ms)
+            api_key=_API_KEY,
+            http_options=types.HttpOptions(
+                timeout=20_000,  # 20秒タイムアウト (ms)
+                retry_options=types.HttpRetryOptions(attempts=1),  # リトライなし
+                httpx_client=self._http,
+            ),
         )
         self._config = types.GenerateContentConfig(
             system_instruction=[types.Part.from_text(text=SYSTEM_PROMPT)],
             response_mime_type="application/json",
         )
 
+    def warm(self) -> None:
+        """DNS 解決と TLS ハンドシェイクを先に済ませておく（起動時に別スレッドで呼ぶ）."""
+        try:
+            self._client.models.get(model=_MODEL)
+        except Exception as e:
+            print(f"⚠ Gemini 接続のウォームアップ失敗: {e}")
+
     def transcribe_and_structure(
         self,
-        audio_bytes: bytes,
+        audio_bytes: bytes | memoryview,
         context: str | None = None,
         emphasis: list[dict] | None = None,
     ) -> dict:
         """音声バイトを送信し、清書テキストと問いを返す.
 
         Args:
-            audio_bytes: WAV 形式のバイト列.
+            audio_bytes: WAV 形式のバイト列（memoryview 可）.
             context: 過去の清書テキスト（マージ用）.
             emphasis: 前回の音声分析で検出された重要ポイント.
 
         Returns:
             {"draft": str, "question": str | None, "emphasis": list}
         """
-        parts: list[types.Part] = [
-            types.Part.from_bytes(mime_type="audio/wav", data=audio_bytes),
-        ]
-
-        user_text = "この音声を清書してください。"
-        if context:
-            user_text += f"\n\n【これまでの清書テキスト（統合して更新してください）】\n{context}"
-        if emphasis:
-            lines = "\n".join(f"- {e['text']}: {e['reason']}" for e in emphasis)
-            user_text += f"\n\n【前回の音声で検出された重要ポイント — 深掘りや清書に活用してください】\n{lines}"
-        parts.append(types.Part.from_text(text=user_text))
+        uploaded = None
+        if len(audio_bytes) > INLINE_AUDIO_LIMIT:
+            # 長い録音はバッファをコピーせずに Files API へ直接アップロード
+            with _BufferReader(audio_bytes) as reader:
+                uploaded = self._client.files.upload(
+                    file=reader,
+                    config=types.UploadFileConfig(mime_type="audio/wav"),
+                )
+            audio_part = types.Part.from_uri(
+                file_uri=uploaded.uri, mime_type="audio/wav",
+            )
+        else:
+            # Blob は bytes のみ受け付けるため、ここで一度だけコピーする
+            audio_part = types.Part.from_bytes(
+                mime_type="audio/wav", data=bytes(audio_bytes),
+            )
+        parts: list[types.Part] = [audio_part]
+
+        if not context and not emphasis:
+            parts.append(_USER_TEXT_BASE)
+        else:
+            user_text = _USER_TEXT
+            if context:
+                user_text += f"\n\n【これまでの清書テキスト（統合して更新してください）】\n{context}"
+            if emphasis:
+                lines = "\n".join(f"- {e['text']}: {e['reason']}" for e in emphasis)
+                user_text += f"\n\n【前回の音声で検出された重要ポイント — 深掘りや清書に活用してください】\n{lines}"
+            parts.append(types.Part.from_text(text=user_text))
 
         contents = [types.Content(role="user", parts=parts)]
 
         # ストリーミングで受信し、最終テキストを結合
-        full_text = ""
-        for chunk in self._client.models.generate_content_stream(
-            model=config.GEMINI_MODEL,
-            contents=contents,
-            config=self._config,
-        ):
-            if chunk.text:
-                full_text += chunk.text
-
-        return self._parse_response(full_text)
+        texts: list[str] = []
+        try:
+            for chunk in self._client.models.generate_content_stream(
+                model=_MODEL,
+                contents=contents,
+                config=self._config,
+            ):
+                if chunk.text:
+                    texts.append(chunk.text)
+        finally:
+            if uploaded is not None:
+                self._delete_file(uploaded.name)
+
+        return self._parse_response("".join(texts))
+
+    def _delete_file(self, name: str) -> None:
+        """アップロードした音声ファイルを削除する（失敗しても続行）."""
+        try:
+            self._client.files.delete(name=name)
+        except Exception as e:
+            print(f"⚠ アップロード済み音声の削除失敗: {e}")
 
     @staticmethod
     def _parse_response(text: str) -> dict:
         """API レスポンスから JSON をパースする."""
-        # コードフェンスが含まれている場合は除去
-        cleaned = re.sub(r"```(?:json)?\s*", "", text).strip().rstrip("`")
         try:
-            data = json.loads(cleaned)
+            # response_mime_type=application/json なので通常はそのまま読める
+            data = _json_loads(text)
         except json.JSONDecodeError:
-            # パース失敗時はそのままテキストを draft として返す
-            data = {"draft": text.strip(), "question": None}
+            # コードフェンスが含まれている場合だけ除去して再試行
+            cleaned = text
+            if "```" in text:
+                cleaned = _FENCE_RE.sub("", text).strip().rstrip("`")
+            try:
+                data = _json_loads(cleaned)
+            except json.JSONDecodeError:
+                # パース失敗時はそのままテキストを draft として返す
+                data = {"draft": text.strip(), "question": None}
 
         return {
             "draft": data.get("draft", ""),
             "question": data.get("question"),
             "emphasis": data.get("emphasis", []),
         }
+
+
+class _BufferReader(io.RawIOBase):
+    """memoryview をコピーせずにシーク可能なファイルとして見せる (Files API 用)."""
+
+    def __init__(self, view: bytes | memoryview) -> None:
+        self._view = memoryview(view)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def close(self) -> None:
+        # 元バッファ (プール) を再利用できるようにエクスポートを解放する
+        self._view.release()
+        super().close()
+
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
@@ -1,33 +1,51 @@
-"""テキスト注入: macOS でアクティブウィンドウへの貼り付け."""
+"""テキスト注入: アクティブウィンドウへの貼り付け.
+
+macOS では Cocoa / CoreGraphics を直接呼び、それ以外 (Windows 版 app.py) では
+pyperclip でクリップボードにコピーして Ctrl+V を送る。
+"""
 
 from __future__ import annotations
 
-import subprocess
+import sys
 import time
 
-import pyperclip
+if sys.platform == "darwin":
+    from AppKit import (
+        NSApplicationActivateIgnoringOtherApps,
+        NSPasteboard,
+        NSPasteboardTypeString,
+        NSWorkspace,
+    )
+    from Quartz import (
+        CGEventCreateKeyboardEvent,
+        CGEventPost,
+        CGEventSetFlags,
+        kCGEventFlagMaskCommand,
+        kCGHIDEventTap,
+    )
+
+# 仮想キーコード: V
+_KEYCODE_V = 9
+
+# アプリ復帰待ちの上限 (秒) とポーリング間隔
+ACTIVATE_TIMEOUT = 0.3
+ACTIVATE_POLL = 0.02
+
 
+class _MacTextInjector:
+    """アクティブアプリを記憶し、テキストをペーストする (macOS版).
 
-class TextInjector:
-    """アクティブアプリを記憶し、テキストをペーストする (macOS版)."""
+    クリップボード・アプリ復帰・Cmd+V はすべて Cocoa / CoreGraphics を
+    直接呼び出し、サブプロセスは起動しない。
+    """
 
     def __init__(self) -> None:
-        self._target_app: str | None = None
+        self._target_app = None  # NSRunningApplication
 
     def save_active_window(self) -> None:
         """現在のフロントアプリを保存する."""
         try:
-            result = subprocess.run(
-                [
-                    "osascript", "-e",
-                    'tell application "System Events" to get name of '
-                    'first application process whose frontmost is true',
-                ],
-                capture_output=True,
-                text=True,
-                timeout=3,
-            )
-            self._target_app = result.stdout.strip() or None
+            self._target_app = NSWorkspace.sharedWorkspace().frontmostApplication()
         except Exception as e:
             print(f"⚠ アクティブウィンドウの取得失敗: {e}")
             self._target_app = None
@@ -39,32 +57,72 @@ class TextInjector:
             成功時 True.
         """
         # クリップボードにコピー
-        pyperclip.copy(text)
+        pb = NSPasteboard.generalPasteboard()
+        pb.clearContents()
+        pb.setString_forType_(text, NSPasteboardTypeString)
 
         # 保存したアプリをフロントに復帰
-        if self._target_app:
+        if self._target_app is not None:
             try:
-                subprocess.run(
-                    ["osascript", "-e", f'tell application "{self._target_app}" to activate'],
-                    capture_output=True,
-                    timeout=3,
+                self._target_app.activateWithOptions_(
+                    NSApplicationActivateIgnoringOtherApps
                 )
-                time.sleep(0.3)  # ウィンドウ切替待ち
+                self._wait_frontmost(self._target_app.processIdentifier())
             except Exception as e:
                 print(f"⚠ アプリ復帰失敗: {e}")
 
-        # Cmd+V でペースト (osascript)
+        # Cmd+V でペースト
         try:
-            subprocess.run(
-                [
-                    "osascript", "-e",
-                    'tell application "System Events" to keystroke "v" using command down',
-                ],
-                capture_output=True,
-                timeout=3,
-            )
+            for key_down in (True, False):
+                event = CGEventCreateKeyboardEvent(None, _KEYCODE_V, key_down)
+                CGEventSetFlags(event, kCGEventFlagMaskCommand)
+                CGEventPost(kCGHIDEventTap, event)
         except Exception as e:
             print(f"⚠ ペースト失敗: {e}")
             return False
 
         return True
+
+    # --- Internal ---
+
+    @staticmethod
+    def _wait_frontmost(pid: int) -> None:
+        """pid のアプリがフロントになるまで待つ（最大 ACTIVATE_TIMEOUT 秒）."""
+        workspace = NSWorkspace.sharedWorkspace()
+        deadline = time.monotonic() + ACTIVATE_TIMEOUT
+        while time.monotonic() < deadline:
+            front = workspace.frontmostApplication()
+            if front is not None and front.processIdentifier() == pid:
+                return
+            time.sleep(ACTIVATE_POLL)
+
+
+class _ClipboardTextInjector:
+    """macOS 以外: クリップボードにコピーして Ctrl+V を送る.
+
+    ホットキーはフォーカスを奪わないので、ウィンドウを閉じれば元のアプリに戻っている。
+    ペーストに失敗してもクリップボードには残るので、手動で貼り付けられる。
+    """
+
+    def save_active_window(self) -> None:
+        """フォーカスは元のアプリに残っているので何もしない."""
+
+    def inject_text(self, text: str) -> bool:
+        """クリップボード経由でテキストをペーストする.
+
+        Returns:
+            成功時 True.
+        """
+        import pyperclip
+
+        pyperclip.copy(text)
+        try:
+            import keyboard
+            keyboard.send("ctrl+v")
+        except Exception as e:
+            print(f"⚠ ペースト失敗 (クリップボードにはコピー済み): {e}")
+            return False
+        return True
+
+
+TextInjector = _MacTextInjector if sys.platform == "darwin" else _ClipboardTextInjector
@@ -7,16 +7,25 @@ customtkinter の FloatingWindow と同じインターフェースを提供す
 from __future__ import annotations
 
 import enum
+import functools
 import math
 from typing import Callable
 
 import objc
 from AppKit import (
+    NSAnimationContext,
+    NSApplicationDidChangeScreenParametersNotification,
     NSPanel,
     NSView,
     NSTextField,
     NSButton,
     NSScrollView,
+    NSTextView,
+    NSAttributedString,
+    NSFontAttributeName,
+    NSForegroundColorAttributeName,
+    NSNoBorder,
+    NSViewWidthSizable,
     NSColor,
     NSFont,
     NSScreen,
@@ -28,12 +37,30 @@ from AppKit import (
     NSTextAlignmentCenter,
     NSLineBreakByWordWrapping,
 )
-from Foundation import NSMakeRect, NSObject
+from Foundation import (
+    NSMakeRect,
+    NSNotificationCenter,
+    NSObject,
+    NSRunLoop,
+    NSRunLoopCommonModes,
+    NSTimer,
+)
+from Quartz import (
+    CABasicAnimation,
+    CALayer,
+    CAMediaTimingFunction,
+    CATransaction,
+    CATransform3DMakeScale,
+    CGPathCreateWithRoundedRect,
+    CGRectMake,
+    kCAMediaTimingFunctionEaseInEaseOut,
+)
 
 import config
 
 
-# ── カラーヘルパー ─────────────────────────────────────────
+# ── カラー / フォントヘルパー (ブリッジ越しの生成は 1 回だけ) ──
+@functools.lru_cache(maxsize=64)
 def _c(h: str) -> NSColor:
     """#RRGGBB → NSColor."""
     h = h.lstrip("#")
@@ -41,6 +68,14 @@ def _c(h: str) -> NSColor:
     return NSColor.colorWithRed_green_blue_alpha_(r / 255, g / 255, b / 255, 1.0)
 
 
+@functools.lru_cache(maxsize=16)
+def _font(size: float, bold: bool = False) -> NSFont:
+    """システムフォント (サイズ・太字ごとにキャッシュ)."""
+    if bold:
+        return NSFont.boldSystemFontOfSize_(size)
+    return NSFont.systemFontOfSize_(size)
+
+
 BG_COL   = _c(config.WINDOW_BG)
 ACC_COL  = _c(config.ACCENT_COLOR)
 TXT_COL  = _c(config.TEXT_COLOR)
@@ -50,6 +85,17 @@ GRN_COL  = _c("#2d8f4e")
 DARK_COL = _c("#0f0f23")
 BORDER_COL = _c("#333355")
 
+# CADisplayLink が使えない環境 (macOS 13 以前) での音量メーター更新間隔（秒）
+VOLUME_TICK_FALLBACK = 1 / 60
+
+# ピル ↔ 展開のサイズ変更アニメーション（秒）: 補間はウィンドウサーバーに任せる
+RESIZE_DURATION = 0.18
+# 角丸 / 影の補間もフレームと同じカーブに揃える
+RESIZE_TIMING = CAMediaTimingFunction.functionWithName_(kCAMediaTimingFunctionEaseInEaseOut)
+
+# レイヤー影を描く余白: パネルはピルよりこの分だけ四方に大きく取る
+SHADOW_PAD = 16
+
 PILL_W, PILL_H     = 320, 60
 EXPAND_W, EXPAND_H = 480, 420
 TOP_MARGIN         = 50  # メニューバー下
@@ -84,6 +130,28 @@ class _ActionHandler(NSObject):
             cb()
 
 
+class _VolumeTicker(NSObject):
+    """ディスプレイリンク / タイマーの tick を Python コールバックに転送する."""
+
+    @objc.python_method
+    def setup(self, callback: Callable[[], None]) -> None:
+        self._callback = callback
+
+    def tick_(self, sender) -> None:
+        self._callback()
+
+
+class _ScreenObserver(NSObject):
+    """画面構成の変更通知を Python コールバックに転送する."""
+
+    @objc.python_method
+    def setup(self, callback: Callable[[], None]) -> None:
+        self._callback = callback
+
+    def screenChanged_(self, notification) -> None:
+        self._callback()
+
+
 # ── ユーティリティ関数 ──────────────────────────────────────
 def _label(
     parent: NSView,
@@ -104,10 +172,7 @@ def _label(
     tf.setSelectable_(False)
     tf.setTextColor_(color)
     tf.setAlignment_(align)
-    if bold:
-        tf.setFont_(NSFont.boldSystemFontOfSize_(size))
-    else:
-        tf.setFont_(NSFont.systemFontOfSize_(size))
+    tf.setFont_(_font(size, bold))
     if wrap:
         tf.setLineBreakMode_(NSLineBreakByWordWrapping)
     parent.addSubview_(tf)
@@ -130,7 +195,7 @@ def _button(
     btn.setTitle_(title)
     btn.setBordered_(bordered)
     btn.setBezelStyle_(0)
-    btn.setFont_(NSFont.boldSystemFontOfSize_(13))
+    btn.setFont_(_font(13, bold=True))
     btn.setTarget_(target)
     btn.setAction_(action)
     btn.setWantsLayer_(True)
@@ -157,63 +222,100 @@ def _colored_view(parent: NSView, rect, color: NSColor, corner: float = 0) -> NS
 class NativeFloatingWindow:
     """NSPanel ベースの Dynamic Island 風フローティングウィンドウ."""
 
-    def __init__(self, callbacks: dict[str, Callable] | None = None) -> None:
+    def __init__(
+        self,
+        callbacks: dict[str, Callable] | None = None,
+        volume_source: Callable[[], float] | None = None,
+    ) -> None:
         self._callbacks = callbacks or {}
+        # 録音中は画面のリフレッシュに合わせて volume_source() を読み、音量バーを更新する
+        self._volume_source = volume_source
+        self._ticker = _VolumeTicker.alloc().init()
+        self._ticker.setup(self._on_volume_tick)
+        self._display_link = None
+        self._volume_timer: NSTimer | None = None
         self._panel: NSPanel | None = None
+        self._pill: NSView | None = None
         self._handler = _ActionHandler.alloc().init()
         self._handler.setup(self._callbacks)
-        self._vol_fill: NSView | None = None
-        self._draft_field: NSTextField | None = None
+        self._vol_fill: CALayer | None = None
+        self._vol_min = 0.0  # フィルの最小幅 (バー全幅に対する比)
+        self._draft_view: NSTextView | None = None
         self._question_field: NSTextField | None = None
+        # 画面サイズ (幅, 可視領域の上端) は、メイン画面が同じで変更通知が来るまで使い回す
+        self._screen: NSScreen | None = None
+        self._screen_geom: tuple[float, float] | None = None
+        self._screen_observer = _ScreenObserver.alloc().init()
+        self._screen_observer.setup(self._invalidate_screen)
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self._screen_observer, "screenChanged:",
+            NSApplicationDidChangeScreenParametersNotification, None,
+        )
+        # 状態ごとの UI はパネル生成時に一度だけ組み立て、表示/非表示で切り替える
+        self._state_views: list[NSView] = []
+        self._size: tuple[int, int] = (PILL_W, PILL_H)
+        # アニメーション完了時の状態 UI 切替が、後から来た切替 / hide を上書きしないための世代
+        self._resize_gen = 0
         self._create_panel()
 
     # ── Public API ────────────────────────────────────────
 
+    def show_loading(self) -> None:
+        """STT モデル読み込み中状態でウィンドウを表示."""
+        self._resize(PILL_W, PILL_H, 26.0, self._loading_view)
+        self._panel.orderFrontRegardless()
+
     def show_recording(self) -> None:
         """録音中状態でウィンドウを表示."""
-        self._resize(PILL_W, PILL_H, corner=26.0)
-        self._clear()
-        self._build_recording_ui()
+        self.update_volume(0.0)
+        self._resize(PILL_W, PILL_H, 26.0, self._rec_view)
         self._panel.orderFrontRegardless()
 
     def show_processing(self) -> None:
         """処理中状態に切り替え."""
-        self._resize(PILL_W, PILL_H, corner=26.0)
-        self._clear()
-        self._build_processing_ui()
+        self._resize(PILL_W, PILL_H, 26.0, self._proc_view)
 
     def show_preview(self, draft: str, question: str | None) -> None:
         """プレビュー状態に切り替え."""
-        self._resize(EXPAND_W, EXPAND_H, corner=16.0)
-        self._clear()
-        self._build_preview_ui()
-        if self._draft_field:
-            self._draft_field.setStringValue_(draft)
-        if self._question_field:
-            if question:
-                self._question_field.setStringValue_(f"💬  {question}")
-            else:
-                self._question_field.setStringValue_("✅  「確定」でテキストを入力します")
+        # TextKit のストレージを差し替えるだけ (ビューは作り直さない)
+        storage = self._draft_view.textStorage()
+        storage.beginEditing()
+        storage.setAttributedString_(
+            NSAttributedString.alloc().initWithString_attributes_(draft, self._draft_attrs)
+        )
+        storage.endEditing()
+        self._draft_view.scrollRangeToVisible_((0, 0))
+        if question:
+            self._question_field.setStringValue_(f"💬  {question}")
+        else:
+            self._question_field.setStringValue_("✅  「確定」でテキストを入力します")
+        self._resize(EXPAND_W, EXPAND_H, 16.0, self._prev_view)
 
     def update_volume(self, rms: float) -> None:
         """音量バーを更新 (0.0〜1.0)."""
         if self._vol_fill is None:
             return
-        level = min(1.0, rms / 0.1)
-        bar_total_w = PILL_W - 110  # ← アイコン・ラベル・ボタン除いた幅
-        frame = self._vol_fill.frame()
-        new_w = max(4.0, bar_total_w * level)
-        self._vol_fill.setFrame_(NSMakeRect(
-            frame.origin.x, frame.origin.y, new_w, frame.size.height
-        ))
+        level = max(self._vol_min, min(1.0, rms / 0.1))
+        # フレームは変えずにレイヤーの横スケールだけ更新 (レイアウトなし・暗黙アニメなし)
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        self._vol_fill.setTransform_(CATransform3DMakeScale(level, 1.0, 1.0))
+        CATransaction.commit()
 
     def hide(self) -> None:
         """ウィンドウを非表示."""
+        self._resize_gen += 1
+        self._stop_volume_updates()
         if self._panel:
             self._panel.orderOut_(None)
 
     def destroy(self) -> None:
         """ウィンドウを破棄."""
+        self._stop_volume_updates()
+        NSNotificationCenter.defaultCenter().removeObserver_(self._screen_observer)
+        if self._display_link is not None:
+            self._display_link.invalidate()
+            self._display_link = None
         if self._panel:
             self._panel.close()
             self._panel = None
@@ -223,7 +325,7 @@ class NativeFloatingWindow:
     def _create_panel(self) -> None:
         style = NSWindowStyleMaskBorderless | NSWindowStyleMaskNonactivatingPanel
         self._panel = NSPanel.alloc().initWithContentRect_styleMask_backing_defer_(
-            NSMakeRect(0, 0, PILL_W, PILL_H),
+            NSMakeRect(0, 0, PILL_W + SHADOW_PAD * 2, PILL_H + SHADOW_PAD * 2),
             style,
             NSBackingStoreBuffered,
             False,
@@ -231,51 +333,177 @@ class NativeFloatingWindow:
         self._panel.setLevel_(NSFloatingWindowLevel)
         self._panel.setBackgroundColor_(NSColor.clearColor())
         self._panel.setOpaque_(False)
-        self._panel.setHasShadow_(True)
+        # ウィンドウサーバーの影はリサイズ毎に形状から再計算されるので使わず、レイヤー影で描く
+        self._panel.setHasShadow_(False)
         self._panel.setMovableByWindowBackground_(True)
         self._panel.setHidesOnDeactivate_(False)
 
-        # コンテナビュー（角丸ダーク背景）
+        # コンテンツビューは透明のまま、影の余白を空けてピル（角丸ダーク背景）を置く
         content = self._panel.contentView()
         content.setWantsLayer_(True)
-        content.layer().setBackgroundColor_(BG_COL.CGColor())
-        content.layer().setCornerRadius_(26.0)
-        content.layer().setBorderWidth_(1.0)
-        content.layer().setBorderColor_(BORDER_COL.CGColor())
+        self._pill = NSView.alloc().initWithFrame_(
+            NSMakeRect(SHADOW_PAD, SHADOW_PAD, PILL_W, PILL_H)
+        )
+        self._pill.setWantsLayer_(True)
+        pill = self._pill.layer()
+        pill.setBackgroundColor_(BG_COL.CGColor())
+        pill.setBorderWidth_(1.0)
+        pill.setBorderColor_(BORDER_COL.CGColor())
+        # 影の形を明示して、毎フレームのアルファからの影計算を避ける
+        pill.setShadowOpacity_(0.35)
+        pill.setShadowRadius_(12.0)
+        pill.setShadowOffset_((0, -2))
+        content.addSubview_(self._pill)
+        self._set_shape(PILL_W, PILL_H, 26.0)
+
+        self._loading_view = self._build_loading_ui()
+        self._rec_view = self._build_recording_ui()
+        self._proc_view = self._build_processing_ui()
+        self._prev_view = self._build_preview_ui()
 
         self._position(PILL_W, PILL_H)
 
-    def _position(self, w: int, h: int) -> None:
-        """画面上部中央に配置."""
+    def _position(self, w: int, h: int, animate: bool = False) -> None:
+        """画面上部中央に配置 (animate なら呼び出し側のアニメーショングループ内で補間)."""
+        # mainScreen() はフォーカスのある画面なので毎回引く (別モニタに移っても通知は来ない)
         screen = NSScreen.mainScreen()
-        sw = screen.frame().size.width
-        sh = screen.visibleFrame().size.height + screen.visibleFrame().origin.y
-        x = (sw - w) / 2
-        y = sh - h - (TOP_MARGIN - 24)
-        self._panel.setFrame_display_(
-            NSMakeRect(x, y, w, h), False
-        )
+        if self._screen_geom is None or screen != self._screen:
+            self._screen = screen
+            visible = screen.visibleFrame()
+            self._screen_geom = (
+                screen.frame().size.width,
+                visible.size.height + visible.origin.y,
+            )
+        sw, sh = self._screen_geom
+        x = (sw - w) / 2 - SHADOW_PAD
+        y = sh - h - (TOP_MARGIN - 24) - SHADOW_PAD
+        frame = NSMakeRect(x, y, w + SHADOW_PAD * 2, h + SHADOW_PAD * 2)
+        pill_frame = NSMakeRect(SHADOW_PAD, SHADOW_PAD, w, h)
+        self._size = (w, h)
+        if animate:
+            self._panel.animator().setFrame_display_(frame, True)
+            self._pill.animator().setFrame_(pill_frame)
+        else:
+            self._panel.setFrame_display_(frame, False)
+            self._pill.setFrame_(pill_frame)
+
+    def _invalidate_screen(self) -> None:
+        """ディスプレイ構成が変わったら次の配置で画面サイズを取り直す."""
+        self._screen_geom = None
+
+    def _resize(self, tw: int, th: int, corner: float, view: NSView) -> None:
+        """ウィンドウサイズ変更 + 角丸更新 + 状態 UI の切替."""
+        self._resize_gen += 1
+        if not self._panel.isVisible() or (tw, th) == self._size:
+            # 非表示 / サイズ据え置きなら即座に変える
+            self._position(tw, th)
+            self._set_shape(tw, th, corner)
+            self._show_view(view)
+            return
 
-    def _resize(self, tw: int, th: int, corner: float = 26.0) -> None:
-        """ウィンドウサイズ変更 + 角丸更新."""
-        self._position(tw, th)
-        cv = self._panel.contentView()
-        cv.layer().setCornerRadius_(corner)
-
-    def _clear(self) -> None:
-        """コンテンツビューのサブビューを全削除."""
-        cv = self._panel.contentView()
-        for sub in list(cv.subviews()):
-            sub.removeFromSuperview()
-        self._vol_fill = None
-        self._draft_field = None
-        self._question_field = None
+        # 表示中はフレームと同じ時間・カーブで角丸 / 影も補間し、
+        # 状態 UI は変形し終わってから差し替える (途中のサイズにはみ出さないように)
+        gen = self._resize_gen
+
+        def changes(ctx) -> None:
+            ctx.setDuration_(RESIZE_DURATION)
+            ctx.setTimingFunction_(RESIZE_TIMING)
+            self._position(tw, th, animate=True)
+            self._set_shape(tw, th, corner, animate=True)
+
+        def done() -> None:
+            if gen == self._resize_gen:
+                self._show_view(view)
+
+        NSAnimationContext.runAnimationGroup_completionHandler_(changes, done)
+
+    def _set_shape(self, w: int, h: int, corner: float, animate: bool = False) -> None:
+        """背景の角丸と shadowPath を更新する."""
+        layer = self._pill.layer()
+        path = CGPathCreateWithRoundedRect(CGRectMake(0, 0, w, h), corner, corner, None)
+        if animate:
+            # ビューのレイヤーは暗黙アニメーションしないので明示的に付ける (途中からでも滑らかに)
+            current = layer.presentationLayer() or layer
+            for key, old, new in (
+                ("cornerRadius", current.cornerRadius(), corner),
+                ("shadowPath", current.shadowPath(), path),
+            ):
+                anim = CABasicAnimation.animationWithKeyPath_(key)
+                anim.setFromValue_(old)
+                anim.setToValue_(new)
+                anim.setDuration_(RESIZE_DURATION)
+                anim.setTimingFunction_(RESIZE_TIMING)
+                layer.addAnimation_forKey_(anim, key)
+        layer.setCornerRadius_(corner)
+        layer.setShadowPath_(path)
+
+    def _state_view(self, w: int, h: int) -> NSView:
+        """状態 UI のコンテナを生成してコンテンツビューに追加 (初期状態は非表示)."""
+        v = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, w, h))
+        v.setHidden_(True)
+        self._pill.addSubview_(v)
+        self._state_views.append(v)
+        return v
+
+    def _show_view(self, view: NSView) -> None:
+        """view だけを表示し、他の状態 UI は隠す."""
+        for v in self._state_views:
+            v.setHidden_(v is not view)
+        if view is self._rec_view:
+            self._start_volume_updates()
+        else:
+            self._stop_volume_updates()
+
+    # ── 内部: 音量メーター ─────────────────────────────────
+
+    def _start_volume_updates(self) -> None:
+        """録音表示の間だけディスプレイリンク (なければタイマー) を動かす."""
+        if self._volume_source is None:
+            return
+        if self._display_link is not None:
+            self._display_link.setPaused_(False)
+            return
+        if self._volume_timer is not None:
+            return
+        try:
+            # macOS 14+: パネルのある画面のリフレッシュに同期する
+            link = self._panel.displayLinkWithTarget_selector_(self._ticker, "tick:")
+        except AttributeError:
+            # macOS 13 以前は CADisplayLink がないので固定間隔のタイマーで代用
+            timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_
+            self._volume_timer = timer(VOLUME_TICK_FALLBACK, self._ticker, "tick:", None, True)
+            return
+        link.addToRunLoop_forMode_(NSRunLoop.mainRunLoop(), NSRunLoopCommonModes)
+        self._display_link = link
+
+    def _stop_volume_updates(self) -> None:
+        if self._display_link is not None:
+            self._display_link.setPaused_(True)
+        if self._volume_timer is not None:
+            self._volume_timer.invalidate()
+            self._volume_timer = None
+
+    def _on_volume_tick(self) -> None:
+        self.update_volume(self._volume_source())
+
+    # ── 内部: 読み込み中 UI ────────────────────────────────
+
+    def _build_loading_ui(self) -> NSView:
+        W, H = PILL_W, PILL_H
+        cv = self._state_view(W, H)
+        _label(
+            cv, "⏳  モデル読み込み中...",
+            NSMakeRect(0, (H - 20) / 2, W, 20),
+            SUB_COL, 13, bold=True,
+            align=NSTextAlignmentCenter,
+        )
+        return cv
 
     # ── 内部: 録音中 UI ────────────────────────────────────
 
-    def _build_recording_ui(self) -> None:
-        cv = self._panel.contentView()
+    def _build_recording_ui(self) -> NSView:
         W, H = PILL_W, PILL_H
+        cv = self._state_view(W, H)
 
         # 🎙 アイコン
         _label(cv, "🎙", NSMakeRect(12, (H - 24) / 2, 24, 24), ACC_COL, 16, align=NSTextAlignmentCenter)
@@ -287,8 +515,16 @@ class NativeFloatingWindow:
         bar_x = 108
         bar_w = W - bar_x - 48
         track = _colored_view(cv, NSMakeRect(bar_x, (H - 4) / 2, bar_w, 4), _c("#2a2a4a"), corner=2.0)
-        # 音量フィル
-        self._vol_fill = _colored_view(track, NSMakeRect(0, 0, 4, 4), ACC_COL, corner=2.0)
+        # 音量フィル: 全幅のレイヤーを左端基準で横に縮める
+        fill = CALayer.layer()
+        fill.setBackgroundColor_(ACC_COL.CGColor())
+        fill.setCornerRadius_(2.0)
+        fill.setAnchorPoint_((0.0, 0.5))
+        fill.setBounds_(((0, 0), (bar_w, 4)))
+        fill.setPosition_((0, 2))
+        track.layer().addSublayer_(fill)
+        self._vol_fill = fill
+        self._vol_min = 4.0 / bar_w
 
         # ⏹ ボタン
         _button(
@@ -297,12 +533,13 @@ class NativeFloatingWindow:
             self._handler, "stopAction:",
             bg=ACC_COL, fg=NSColor.whiteColor(), corner=16.0,
         )
+        return cv
 
     # ── 内部: 処理中 UI ────────────────────────────────────
 
-    def _build_processing_ui(self) -> None:
-        cv = self._panel.contentView()
+    def _build_processing_ui(self) -> NSView:
         W, H = PILL_W, PILL_H
+        cv = self._state_view(W, H)
         label = (
             "🔄  Whisper 文字起こし中..."
             if not config.GEMINI_API_KEY
@@ -314,12 +551,13 @@ class NativeFloatingWindow:
             YEL_COL, 13, bold=True,
             align=NSTextAlignmentCenter,
         )
+        return cv
 
     # ── 内部: プレビュー UI ────────────────────────────────
 
-    def _build_preview_ui(self) -> None:
-        cv = self._panel.contentView()
+    def _build_preview_ui(self) -> NSView:
         W, H = EXPAND_W, EXPAND_H
+        cv = self._state_view(W, H)
         PAD = 20
 
         # タイトル
@@ -330,18 +568,40 @@ class NativeFloatingWindow:
         # 区切り線
         sep = _colored_view(cv, NSMakeRect(PAD, H - 52, W - PAD * 2, 1), BORDER_COL)
 
-        # テキストエリア（NSTextField, スクロールなし for simplicity）
+        # テキストエリア（NSScrollView + 読み取り専用 NSTextView）
         TEXT_H = H - 52 - 24 - 50 - 60  # ≒ 234
-        self._draft_field = _label(
-            cv, "",
-            NSMakeRect(PAD, H - 52 - TEXT_H, W - PAD * 2, TEXT_H),
-            TXT_COL, 14, wrap=True,
+        scroll = NSScrollView.alloc().initWithFrame_(
+            NSMakeRect(PAD, H - 52 - TEXT_H, W - PAD * 2, TEXT_H)
         )
-        self._draft_field.setSelectable_(True)
-        self._draft_field.setDrawsBackground_(True)
-        self._draft_field.setBackgroundColor_(DARK_COL)
-        self._draft_field.setWantsLayer_(True)
-        self._draft_field.layer().setCornerRadius_(8.0)
+        scroll.setBorderType_(NSNoBorder)
+        scroll.setHasVerticalScroller_(True)
+        scroll.setAutohidesScrollers_(True)
+        scroll.setDrawsBackground_(True)
+        scroll.setBackgroundColor_(DARK_COL)
+        scroll.setWantsLayer_(True)
+        scroll.layer().setCornerRadius_(8.0)
+        scroll.layer().setMasksToBounds_(True)
+
+        size = scroll.contentSize()
+        tv = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, size.width, size.height))
+        tv.setEditable_(False)
+        tv.setSelectable_(True)
+        tv.setRichText_(False)
+        tv.setDrawsBackground_(False)
+        tv.setTextContainerInset_((8, 8))
+        tv.setMinSize_((0, size.height))
+        tv.setMaxSize_((1e7, 1e7))
+        tv.setVerticallyResizable_(True)
+        tv.setHorizontallyResizable_(False)
+        tv.setAutoresizingMask_(NSViewWidthSizable)
+        tv.textContainer().setWidthTracksTextView_(True)
+        scroll.setDocumentView_(tv)
+        cv.addSubview_(scroll)
+        self._draft_view = tv
+        self._draft_attrs = {
+            NSFontAttributeName: _font(14),
+            NSForegroundColorAttributeName: TXT_COL,
+        }
 
         # 問いかけラベル
         self._question_field = _label(
@@ -366,3 +626,4 @@ class NativeFloatingWindow:
                 NSMakeRect(PAD + 268, BTN_Y, 110, 34),
                 self._handler, "cancelAction:",
                 fg=SUB_COL, corner=8.0)
+        return cv
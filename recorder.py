@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
-import io
-import threading
-import time
+import functools
+import queue
+import struct
 from typing import Callable
 
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
 
 import config
+from audio_kernels import downmix, rms_and_silence
+
+# WAV バッファプール: セッションごとの数百 KB の確保/解放を避けて使い回す
+_WAV_HEADER_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_HEADER_SIZE = _WAV_HEADER_STRUCT.size  # 44
+_WAV_BUFFER_POOL: queue.LifoQueue[bytearray] = queue.LifoQueue(maxsize=2)
+
+# VAD (webrtcvad) のフレーム長 (ms): 10 / 20 / 30 のいずれか
+_VAD_FRAME_MS = 30
 
 
 class AudioRecorder:
@@ -20,17 +28,28 @@ class AudioRecorder:
     def __init__(
         self,
         on_silence: Callable[[], None] | None = None,
-        on_volume: Callable[[float], None] | None = None,
     ) -> None:
         self._on_silence = on_silence
-        self._on_volume = on_volume
+
+        # 最新の RMS（録音スレッドが書き、UI スレッドがタイマーで読む単一スロット）
+        self._latest_rms: float = 0.0
 
         self._is_recording = False
-        self._audio_data: list[np.ndarray] = []
-        self._lock = threading.Lock()
+        # 直前の get_audio_*() が「データはあるが発話なし」で None を返したか
+        self._no_speech = False
+        # 録音バッファは最大長ぶんを一度だけ確保し、書き込み位置だけ進める
+        self._buf = np.empty(
+            (config.SAMPLE_RATE * config.MAX_RECORD_SECONDS, config.CHANNELS),
+            dtype=config.DTYPE,
+        )
+        # 書き込むのはコールバックだけ (単一ライター)。start()/stop() はカーソルと
+        # フラグを切り替えるだけなので、RT スレッドではロックを取らない
+        self._write = 0
 
-        # 沈黙検知用
-        self._silence_start: float | None = None
+        # 沈黙検知用（連続した沈黙フレーム数で判定する）
+        self._silent_frames = 0
+        self._silence_threshold = config.SILENCE_THRESHOLD
+        self._silence_limit = int(config.SILENCE_DURATION * config.SAMPLE_RATE)
 
         # 音声入力ストリーム（アプリ生存中ずっと開いておく）
         self._stream = sd.InputStream(
@@ -45,31 +64,77 @@ class AudioRecorder:
 
     def start(self) -> None:
         """録音を開始する."""
-        with self._lock:
-            self._audio_data = []
-            self._silence_start = None
-            self._is_recording = True
+        self._write = 0
+        self._silent_frames = 0
+        self._latest_rms = 0.0
+        self._is_recording = True  # 最後に立てる (コールバックはこれを見て書き始める)
 
     def stop(self) -> np.ndarray | None:
-        """録音を停止し、録音データを返す. データがなければ None."""
-        with self._lock:
-            self._is_recording = False
-            if not self._audio_data:
-                return None
-            return np.concatenate(self._audio_data, axis=0)
+        """録音を停止し、録音データを返す. データがなければ None.
+
+        返り値は内部バッファのビュー (コピーなし) で、次の start() まで有効。
+        """
+        self._is_recording = False
+        # 沈黙検知で止めた後もカウントが閾値以上のまま残らないよう、ここで戻す
+        self._silent_frames = 0
+        n = self._write
+        if n == 0:
+            return None
+        return self._buf[:n]
 
     @property
     def is_recording(self) -> bool:
         return self._is_recording
 
-    def get_audio_bytes(self) -> bytes | None:
-        """現在のバッファを WAV バイト列として返す（API 送信用）."""
-        data = self.stop()
+    @property
+    def no_speech(self) -> bool:
+        """直前の get_audio_buffer() / get_audio_array() が発話なしで None を返したか."""
+        return self._no_speech
+
+    @property
+    def latest_rms(self) -> float:
+        """録音中の直近のオーディオブロックの RMS（UI のポーリング用）."""
+        return self._latest_rms
+
+    def get_audio_buffer(self) -> memoryview | None:
+        """現在のバッファを 16bit PCM WAV として返す（API 送信用）.
+
+        返り値はプールされた bytearray への memoryview。
+        使い終わったら必ず release_buffer() で返却すること。
+        """
+        data = self._stop_with_speech()
         if data is None:
             return None
-        buf = io.BytesIO()
-        sf.write(buf, data, config.SAMPLE_RATE, format="WAV")
-        return buf.getvalue()
+        size = _WAV_HEADER_SIZE + data.size * 2
+        try:
+            buf = _WAV_BUFFER_POOL.get_nowait()
+        except queue.Empty:
+            buf = bytearray(size)
+        if len(buf) < size:
+            buf.extend(bytes(size - len(buf)))
+        _write_wav(buf, data)
+        return memoryview(buf)[:size]
+
+    def get_audio_array(self) -> np.ndarray | None:
+        """現在のバッファを 16kHz float32 mono の配列として返す（ローカル Whisper 用）.
+
+        WAV へのエンコード/デコードを経由しない。返り値は内部バッファとは独立したコピー。
+        """
+        data = self._stop_with_speech()
+        if data is None:
+            return None
+        if data.shape[1] > 1:
+            return downmix(data)
+        return data[:, 0].copy()
+
+    def release_buffer(self, view: memoryview) -> None:
+        """get_audio_buffer() で受け取ったバッファをプールに返却する."""
+        buf = view.obj
+        view.release()
+        try:
+            _WAV_BUFFER_POOL.put_nowait(buf)
+        except queue.Full:
+            pass  # プールが満杯なら GC に任せる
 
     def close(self) -> None:
         """ストリームを閉じる."""
@@ -78,31 +143,97 @@ class AudioRecorder:
 
     # --- Internal ---
 
+    def _stop_with_speech(self) -> np.ndarray | None:
+        """録音を停止し、発話が含まれていればデータを返す."""
+        data = self.stop()
+        self._no_speech = False
+        if data is None:
+            return None
+        if not _contains_speech(data):
+            print("🔇  発話が検出されませんでした")
+            self._no_speech = True
+            return None
+        return data
+
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info, status
     ) -> None:
         """sounddevice のコールバック."""
-        if status:
+        # 入力で問題になるのは取りこぼし (overflow) だけなので、それ以外は見ない
+        if status.input_overflow:
             print(f"  ⚠ {status}", flush=True)
 
-        # RMS 計算 → 音量コールバック
-        rms = float(np.sqrt(np.mean(indata**2)))
-        if self._on_volume:
-            self._on_volume(rms)
+        if not self._is_recording:
+            return
+        # 前回の沈黙フレーム数は録音中を確認してから読む (停止中の古い値を持ち越さない)
+        # RMS + 沈黙フレーム数を 1 パスで計算 → RMS はスロットに書くだけ
+        rms, silent_frames = rms_and_silence(
+            indata, self._silence_threshold, self._silent_frames
+        )
+        self._latest_rms = rms
 
-        with self._lock:
-            if not self._is_recording:
-                return
-            self._audio_data.append(indata.copy())
+        end = self._write + len(indata)
+        if end > len(self._buf):
+            self._grow(end)
+        self._buf[self._write:end] = indata
+        self._write = end
 
         # 沈黙検知
-        now = time.time()
-        if rms < config.SILENCE_THRESHOLD:
-            if self._silence_start is None:
-                self._silence_start = now
-            elif now - self._silence_start >= config.SILENCE_DURATION:
-                # 沈黙が規定秒数続いた
-                if self._on_silence and self._is_recording:
-                    self._on_silence()
-        else:
-            self._silence_start = None
+        self._silent_frames = silent_frames
+        if silent_frames >= self._silence_limit:
+            # 沈黙が規定秒数続いた
+            if self._on_silence and self._is_recording:
+                self._on_silence()
+
+    def _grow(self, needed: int) -> None:
+        """録音が最大長を超えたときだけバッファを倍に拡張する (コールバックから呼ぶ)."""
+        grown = np.empty((max(needed, 2 * len(self._buf)), self._buf.shape[1]),
+                         dtype=self._buf.dtype)
+        grown[:self._write] = self._buf[:self._write]
+        self._buf = grown
+
+
+def _write_wav(buf: bytearray, data: np.ndarray) -> None:
+    """float32 の録音データを 16bit PCM WAV として buf の先頭に書き込む."""
+    channels = data.shape[1]
+    data_size = data.size * 2
+    _WAV_HEADER_STRUCT.pack_into(
+        buf, 0,
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, config.SAMPLE_RATE,
+        config.SAMPLE_RATE * channels * 2, channels * 2, 16,
+        b"data", data_size,
+    )
+    # float32 → int16: 一時配列は clip の 1 つだけ、最後は WAV バッファへ直接書く
+    scaled = np.clip(data.reshape(-1), -1.0, 1.0)
+    np.multiply(scaled, 32767, out=scaled)
+    pcm = np.frombuffer(buf, dtype="<i2", count=data.size, offset=_WAV_HEADER_SIZE)
+    np.copyto(pcm, scaled, casting="unsafe")
+    del pcm  # buf へのエクスポートを解放（後で extend できるように）
+
+
+@functools.cache
+def _vad():
+    """webrtcvad があれば最も厳しいモードの Vad を返す. なければ None."""
+    try:
+        import webrtcvad  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return webrtcvad.Vad(3)
+
+
+def _contains_speech(data: np.ndarray) -> bool:
+    """録音に発話が含まれるか判定する（最初の発話フレームで打ち切り）.
+
+    webrtcvad が無い場合は常に True（ゲートしない）。
+    """
+    vad = _vad()
+    if vad is None or config.SAMPLE_RATE not in (8000, 16000, 32000, 48000):
+        return True
+    frame = config.SAMPLE_RATE * _VAD_FRAME_MS // 1000
+    mono = data[:, 0]
+    for start in range(0, len(mono) - frame + 1, frame):
+        pcm = np.clip(mono[start:start + frame], -1.0, 1.0) * 32767
+        if vad.is_speech(pcm.astype("<i2").tobytes(), config.SAMPLE_RATE):
+            return True
+    return False
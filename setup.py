@@ -18,6 +18,10 @@ DATA_FILES = [
 
 OPTIONS = {
     "argv_emulation": False,  # macOS 13+ では False 推奨
+    "optimize": 2,            # -OO 相当: assert と docstring を除いた .pyc を同梱
+    "compressed": True,       # ライブラリを zip 圧縮
+    "strip": True,            # ネイティブ拡張のデバッグシンボルを除去
+    "semi_standalone": False, # Python 本体も同梱（システムの Python を探しに行かない）
     "packages": [
         "customtkinter",    # 万が一 fallback で使う場合
         "sounddevice",
@@ -27,7 +31,6 @@ OPTIONS = {
         "google",
         "dotenv",
         "keyboard",
-        "pyperclip",
     ],
     "frameworks": [],
     "includes": [
@@ -36,6 +39,7 @@ OPTIONS = {
         "Quartz",
         "objc",
         "recorder",
+        "audio_kernels",
         "gemini_client",
         "whisper_client",
         "injector",
@@ -44,7 +48,17 @@ OPTIONS = {
         "native_statusbar",
         "app_native",
     ],
-    "excludes": ["tkinter", "customtkinter"],
+    "excludes": [
+        "tkinter",
+        "customtkinter",
+        # 実行時に使わない大きなサブパッケージ
+        "torch.distributions",
+        "torch.testing",
+        "torch.onnx",
+        "sympy.plotting",
+        "matplotlib",
+        "IPython",
+    ],
     "plist": {
         "CFBundleName":             "VoiceDraft",
         "CFBundleDisplayName":      "VoiceDraft",
@@ -17,6 +17,7 @@ import config
 class AppState(enum.Enum):
     """フローティングウィンドウの表示状態."""
 
+    LOADING = "loading"
     RECORDING = "recording"
     PROCESSING = "processing"
     PREVIEW = "preview"
@@ -129,42 +130,19 @@ class FloatingWindow:
         for widget in self._container.winfo_children():
             widget.destroy()
 
-        if state == AppState.RECORDING:
+        if state == AppState.LOADING:
+            self._build_loading_ui()
+        elif state == AppState.RECORDING:
             self._build_recording_ui()
         elif state == AppState.PROCESSING:
             self._build_processing_ui()
         elif state == AppState.PREVIEW:
             self._build_preview_ui()
 
-        self._animate_resize(target_w, target_h)
+        # Tk 側で補間すると 1 ステップごとに CTk ウィジェット全体が再レイアウトされるため、一度で変える
+        self._set_geometry(target_w, target_h)
 
-    # --- Internal: アニメーション ---
-
-    def _animate_resize(self, tw: int, th: int, steps: int = 8) -> None:
-        """ウィンドウサイズを ease-out cubic で遷移する."""
-        if not self._window or not self._window.winfo_exists():
-            return
-        self._window.update_idletasks()
-        cw = self._window.winfo_width()
-        ch = self._window.winfo_height()
-
-        if cw <= 1 or (cw == tw and ch == th):
-            self._set_geometry(tw, th)
-            return
-
-        interval = max(1, 120 // steps)
-
-        def step(i: int) -> None:
-            if not self._window or not self._window.winfo_exists():
-                return
-            if i >= steps:
-                self._set_geometry(tw, th)
-                return
-            t = 1 - (1 - (i + 1) / steps) ** 3
-            self._set_geometry(int(cw + (tw - cw) * t), int(ch + (th - ch) * t))
-            self._window.after(interval, lambda: step(i + 1))
-
-        step(0)
+    # --- Internal: 配置 ---
 
     def _set_geometry(self, w: int, h: int) -> None:
         """ウィンドウを画面上部中央に配置する."""
@@ -174,6 +152,16 @@ class FloatingWindow:
         x = (sw - w) // 2
         self._window.geometry(f"{w}x{h}+{x}+{self.TOP_MARGIN}")
 
+    # --- Internal: 読み込み中 UI (ピル型) ---
+
+    def _build_loading_ui(self) -> None:
+        """STT モデル読み込み中のピル型 UI."""
+        ctk.CTkLabel(
+            self._container, text="⏳  モデル読み込み中...",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            text_color=config.SUBTEXT_COLOR,
+        ).pack(expand=True)
+
     # --- Internal: 録音中 UI (ピル型) ---
 
     def _build_recording_ui(self) -> None:
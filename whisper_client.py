@@ -6,66 +6,135 @@ AI による清書はなく、Whisper の生テキストをそのまま返す。
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import io
+import os
+import platform
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import soundfile as sf
 
 import config
+from audio_kernels import downmix
+
+# mlx-whisper 用の変換済みモデル (Hugging Face リポジトリ)
+_MLX_REPOS = {"large": "mlx-community/whisper-large-v3-mlx"}
 
 
 class WhisperClient:
-    """openai-whisper を使ってローカルで音声文字起こしを行う."""
+    """ローカル Whisper で音声文字起こしを行う.
 
-    def __init__(self) -> None:
-        try:
-            import whisper  # type: ignore
-        except ImportError as e:
-            raise ImportError(
-                "openai-whisper がインストールされていません。\n"
-                "  pip install openai-whisper\n"
-                "または\n"
-                "  uv add openai-whisper"
-            ) from e
+    Apple Silicon で mlx-whisper がインストールされていれば GPU (Metal) で推論し、
+    次に faster-whisper の int8 量子化モデル (CTranslate2)、
+    どちらもなければ openai-whisper にフォールバックする。
+    推論は専用のワーカースレッド 1 本で順番に実行する。
+    """
 
+    def __init__(self) -> None:
         model_name = config.WHISPER_MODEL
+        self._fp16 = False  # openai-whisper を MPS で動かすときだけ True
         print(f"🔧 Whisper モデル '{model_name}' を読み込み中...")
-        self._model = whisper.load_model(model_name)
-        print(f"✅ Whisper '{model_name}' 準備完了（オフラインモード）")
+        if _mlx_available():
+            import mlx_whisper  # type: ignore[import-not-found]
+            repo = _MLX_REPOS.get(model_name, f"mlx-community/whisper-{model_name}-mlx")
+            self._backend = "mlx-whisper"
+            # モデルは初回推論時に読み込まれ、以降はキャッシュされる
+            self._model = functools.partial(mlx_whisper.transcribe, path_or_hf_repo=repo)
+        else:
+            self._load_torch_or_ct2(model_name)
+
+        # 推論用のワーカー。モデルの状態を 1 スレッドに閉じ込め、呼び出しは順番に処理する
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+        # 1 秒の無音で初回推論 (カーネル選択・Metal シェーダのコンパイル等) を先に済ませる。
+        # ワーカーは 1 本なので、本番の推論は自動的にこの後ろに並ぶ
+        self._warmup = self._executor.submit(
+            self._transcribe, np.zeros(16000, dtype=np.float32), True
+        )
+        print(f"✅ Whisper '{model_name}' 準備完了（オフラインモード / {self._backend}）")
+
+    def _load_torch_or_ct2(self, model_name: str) -> None:
+        """faster-whisper、なければ openai-whisper でモデルを読み込む."""
+        try:
+            from faster_whisper import WhisperModel  # type: ignore[import-not-found]
+        except ImportError:
+            WhisperModel = None
+
+        if WhisperModel is not None:
+            # int8: CPU で 2〜4 倍高速、精度低下はほぼなし (CUDA があれば GPU を使う)
+            self._backend = "faster-whisper"
+            self._model = WhisperModel(model_name, device="auto", compute_type="int8")
+        else:
+            try:
+                import whisper  # type: ignore
+            except ImportError as e:
+                raise ImportError(
+                    "openai-whisper がインストールされていません。\n"
+                    "  pip install openai-whisper  (または faster-whisper)\n"
+                    "または\n"
+                    "  uv add openai-whisper"
+                ) from e
+            self._backend = "openai-whisper"
+            try:
+                self._model = _load_whisper_mmap(whisper, model_name)
+            except Exception as e:
+                # 古い torch (mmap 非対応) や未知のモデル名は通常の読み込みに任せる
+                print(f"ℹ  mmap 読み込みをスキップ: {e}")
+                self._model = whisper.load_model(model_name)
+            self._try_mps()
+
+    def _try_mps(self) -> None:
+        """Apple Silicon の GPU (MPS) が使えれば移して fp16 で推論する."""
+        import torch  # type: ignore[import-not-found]
+
+        if not torch.backends.mps.is_available():
+            return
+        try:
+            self._model = self._model.to("mps")
+        except (NotImplementedError, RuntimeError) as e:
+            # 一部の演算 (疎テンソル等) が MPS 未対応の torch では CPU のまま
+            print(f"ℹ  MPS を使わず CPU で推論します: {e}")
+            self._model = self._model.to("cpu")
+            return
+        self._backend = "openai-whisper / mps"
+        self._fp16 = True
+
+    def warm(self) -> None:
+        """__init__ で投入したウォームアップ推論の完了を待つ."""
+        try:
+            self._warmup.result()
+        except Exception as e:
+            print(f"⚠ Whisper のウォームアップ失敗: {e}")
 
     def transcribe_and_structure(
         self,
-        audio_bytes: bytes,
+        audio: bytes | memoryview | np.ndarray,
         context: str | None = None,
         emphasis: list[dict] | None = None,
     ) -> dict:
-        """WAV バイト列を文字起こしして draft として返す.
+        """音声を文字起こしして draft として返す.
 
         GeminiClient と同じシグネチャ。context は文字列結合で対応。
+        audio には WAV バイト列のほか、AudioRecorder.get_audio_array() の
+        float32 mono 配列 (config.SAMPLE_RATE) をそのまま渡せる。
         """
-        import whisper  # type: ignore
-
-        # WAV → numpy array (float32 / 16kHz mono)
-        buf = io.BytesIO(audio_bytes)
-        data, samplerate = sf.read(buf, dtype="float32")
+        if isinstance(audio, np.ndarray):
+            data, samplerate = audio, config.SAMPLE_RATE
+        else:
+            # WAV → numpy array (float32)
+            data, samplerate = _soundfile().read(io.BytesIO(audio), dtype="float32")
 
         # ステレオの場合はモノラルに変換
         if data.ndim > 1:
-            data = data.mean(axis=1)
+            data = downmix(data) if data.shape[1] > 1 else data[:, 0]
 
         # Whisper は 16kHz float32 を期待 — config.SAMPLE_RATE は 16000 なので通常不要
         if samplerate != 16000:
             import resampy  # type: ignore[import-not-found]
             data = resampy.resample(data, samplerate, 16000)
 
-        # fp16=False: CPU でも安定動作
-        result = self._model.transcribe(
-            data,
-            language="ja",
-            fp16=False,
-            verbose=False,
-        )
-        transcript: str = result["text"].strip()
+        transcript = self._executor.submit(self._transcribe, data).result()
 
         # コンテキストがある場合は末尾に追記
         if context:
@@ -78,3 +147,82 @@ class WhisperClient:
             "question": None,   # ローカルモードでは AI 問いかけなし
             "emphasis": [],
         }
+
+    def _transcribe(self, data: np.ndarray, warmup: bool = False) -> str:
+        """16kHz float32 mono の配列を文字起こしする.
+
+        warmup=True のときは無音でもエンコーダ/デコーダまで通す (VAD で捨てない)。
+        """
+        if self._backend == "faster-whisper":
+            # greedy デコード + 内蔵 VAD で無音区間を飛ばす
+            segments, _ = self._model.transcribe(
+                data, language="ja", beam_size=1, vad_filter=not warmup,
+            )
+            return "".join(seg.text for seg in segments).strip()
+
+        if self._backend == "mlx-whisper":
+            return self._model(data, language="ja", verbose=None)["text"].strip()
+
+        # fp16 は MPS のときだけ (CPU では fp32 の方が安定)
+        try:
+            result = self._model.transcribe(
+                data,
+                language="ja",
+                fp16=self._fp16,
+                verbose=False,
+            )
+        except (NotImplementedError, RuntimeError) as e:
+            if not self._fp16:
+                raise
+            print(f"⚠ MPS での推論に失敗 → CPU に切り替えます: {e}")
+            self._model = self._model.to("cpu")
+            self._fp16 = False
+            return self._transcribe(data)
+        return result["text"].strip()
+
+
+def _load_whisper_mmap(whisper, model_name: str):
+    """openai-whisper のチェックポイントを mmap で読み込む.
+
+    whisper.load_model() はファイル全体を一度メモリに読み込むが、
+    mmap なら OS が必要なページだけを読み込む (torch >= 2.1)。
+
+    whisper._MODELS / _download / _ALIGNMENT_HEADS は openai-whisper の非公開 API。
+    バージョンアップで変わると呼び出し側の except で load_model() に戻るので、
+    「mmap 読み込みをスキップ」が毎回出るようならここを見直すこと。
+    """
+    import torch  # type: ignore[import-not-found]
+    from whisper.model import ModelDimensions, Whisper  # type: ignore
+
+    if model_name not in whisper._MODELS:
+        raise ValueError(f"未知のモデル名です: {model_name}")
+    default = os.path.join(os.path.expanduser("~"), ".cache")
+    root = os.path.join(os.getenv("XDG_CACHE_HOME", default), "whisper")
+    # 未ダウンロードならここで取得する (チェックサム検証込み)
+    path = whisper._download(whisper._MODELS[model_name], root, False)
+
+    checkpoint = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+    model = Whisper(ModelDimensions(**checkpoint["dims"]))
+    # 重みは fp16 で保存されているため assign=True で mmap を直接参照させず、
+    # 推論用の fp32 パラメータへコピーする
+    model.load_state_dict(checkpoint["model_state_dict"])
+    model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_name])
+    # load_model() と同じデバイス選択 (MPS は呼び出し側の _try_mps() で上書き)
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    return model.to(device)
+
+
+@functools.cache
+def _soundfile():
+    """soundfile (libsndfile) は WAV バイト列を渡されたときだけ読み込む."""
+    import soundfile  # type: ignore[import-not-found]
+    return soundfile
+
+
+def _mlx_available() -> bool:
+    """Apple Silicon の macOS で mlx-whisper が使えるか."""
+    return (
+        sys.platform == "darwin"
+        and platform.machine() == "arm64"
+        and importlib.util.find_spec("mlx_whisper") is not None
+    )